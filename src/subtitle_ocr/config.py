@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -21,9 +22,11 @@ class Defaults:
 
 
 def _env_path(name: str, default: str) -> Path:
-    return Path(os.getenv(name, default)).expanduser().resolve()
+    p = Path(os.getenv(name, default)).expanduser()
+    return p if p.is_absolute() else p.resolve()
 
 
+@functools.lru_cache(maxsize=1)
 def project_root() -> Path:
     """Best-effort project root.
 
@@ -37,22 +40,33 @@ def project_root() -> Path:
         return Path.cwd().resolve()
 
 
+@functools.lru_cache(maxsize=8)
 def _default_tessdata_dir(root: Path) -> Optional[Path]:
     p = (root / "tessdata_best").resolve()
     return p if p.exists() else None
 
 
+@functools.lru_cache(maxsize=1)
 def _default_mkvtoolnix_dir() -> Optional[Path]:
     p = Path(r"C:\Program Files\MKVToolNix")
     return p if p.exists() else None
 
 
+def _reset_defaults_cache() -> None:
+    _default_tessdata_dir.cache_clear()
+    _default_mkvtoolnix_dir.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
 def load_defaults(env_file: str | None = None) -> Defaults:
     """Load configuration defaults from .env / environment.
 
     Step 2 (stabilized):
     - avoid import-time fixed globals;
-    - configuration is reloadable/testable.
+    - configuration is reloadable/testable (see `reload_defaults`).
+
+    Results are cached per `env_file`: parsing .env and probing the filesystem
+    happens once per process unless `reload_defaults()` is called.
 
     Additional policy:
     - MKVTOOLNIX_DIR defaults to a standard Windows install path *only if it exists*.
@@ -102,6 +116,14 @@ def load_defaults(env_file: str | None = None) -> Defaults:
     )
 
 
+def reload_defaults(env_file: str | None = None) -> Defaults:
+    """Drop cached defaults and load them again (e.g. after editing .env)."""
+    load_defaults.cache_clear()
+    _reset_defaults_cache()
+    # Same call shape as plain `load_defaults()` so both share one cache entry.
+    return load_defaults(env_file) if env_file else load_defaults()
+
+
 def ensure_dirs(input_dir: Path, output_dir: Path, log_dir: Path) -> None:
     input_dir.mkdir(parents=True, exist_ok=True)
     output_dir.mkdir(parents=True, exist_ok=True)
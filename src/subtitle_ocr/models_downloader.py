@@ -1,41 +1,145 @@
-import io
+import functools
+import gzip
 import json
+import os
+import shutil
+import ssl
+import tempfile
+import time
+import urllib.error
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from typing import IO, Callable, Dict, Optional, Tuple
 
 LogFn = Optional[Callable[[str], None]]
 
+RELEASE_CACHE_FILE = ".release_cache.json"
+_COPY_CHUNK = 1024 * 1024
+_RETRIES = 3
+_RETRY_BACKOFF = 0.5
+
 
 def _log(log: LogFn, msg: str) -> None:
     if log:
         log(msg)
 
 
-def _http_get_json(url: str, log: LogFn = None) -> dict:
-    req = urllib.request.Request(
-        url,
-        headers={
-            # GitHub API: set a UA
-            "User-Agent": "subtitle-ocr-pro",
-            "Accept": "application/vnd.github+json",
-        },
-        method="GET",
-    )
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        data = resp.read()
-    return json.loads(data.decode("utf-8"))
+@functools.lru_cache(maxsize=1)
+def _opener() -> urllib.request.OpenerDirector:
+    # Shared by all requests: plain urlopen() builds a fresh default SSL context
+    # (loading the CA store) for every HTTPS connection.
+    ctx = ssl.create_default_context()
+    return urllib.request.build_opener(urllib.request.HTTPSHandler(context=ctx))
+
+
+def _open(req: urllib.request.Request, timeout: float, log: LogFn = None):
+    """Open `req`, retrying connection errors and HTTP 5xx with backoff."""
+    for attempt in range(1, _RETRIES + 1):
+        try:
+            return _opener().open(req, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            if e.code < 500 or attempt == _RETRIES:
+                raise
+            err: Exception = e
+        except (urllib.error.URLError, TimeoutError) as e:
+            if attempt == _RETRIES:
+                raise
+            err = e
+        delay = _RETRY_BACKOFF * (2 ** (attempt - 1))
+        _log(log, f"Retrying in {delay:.1f}s ({type(err).__name__}: {err})")
+        time.sleep(delay)
+
+
+def _read_release_cache(cache_path: Optional[Path], url: str) -> Optional[dict]:
+    if not cache_path:
+        return None
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("url") != url:
+        return None
+    return cached
+
+
+def _write_release_cache(cache_path: Optional[Path], entry: dict) -> None:
+    if not cache_path:
+        return
+    try:
+        cache_path.write_text(json.dumps(entry), encoding="utf-8")
+    except OSError:
+        pass
+
 
+def _http_get_json(
+    url: str, log: LogFn = None, cache_path: Optional[Path] = None
+) -> dict:
+    """GET a JSON document.
 
-def _http_download(url: str, log: LogFn = None) -> bytes:
+    With `cache_path`, the body is stored with its ETag/Last-Modified and the
+    next call is a conditional GET; a 304 reuses the cached body (GitHub does
+    not count those against the unauthenticated rate limit).
+    """
+    headers = {
+        # GitHub API: set a UA
+        "User-Agent": "subtitle-ocr-pro",
+        "Accept": "application/vnd.github+json",
+        "Accept-Encoding": "gzip",
+    }
+    cached = _read_release_cache(cache_path, url)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    req = urllib.request.Request(url, headers=headers, method="GET")
+    try:
+        with _open(req, timeout=30, log=log) as resp:
+            data = resp.read()
+            if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+                data = gzip.decompress(data)
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            _log(log, "Release info unchanged (304), using cached copy.")
+            return cached["body"]
+        raise
+
+    body = json.loads(data.decode("utf-8"))
+    if etag or last_modified:
+        _write_release_cache(
+            cache_path,
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body,
+            },
+        )
+    return body
+
+
+def _http_download(url: str, dst: IO[bytes], log: LogFn = None) -> None:
+    """Stream `url` into the binary file object `dst`."""
     req = urllib.request.Request(
         url,
         headers={"User-Agent": "subtitle-ocr-pro"},
         method="GET",
     )
-    with urllib.request.urlopen(req, timeout=120) as resp:
-        return resp.read()
+    with _open(req, timeout=120, log=log) as resp:
+        shutil.copyfileobj(resp, dst, length=_COPY_CHUNK)
+
+
+def _extract_member(
+    zf: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path, log: LogFn = None
+) -> None:
+    _log(log, f"Extracting: {target.name} -> {target}")
+    with zf.open(info, "r") as src, target.open("wb") as dst:
+        shutil.copyfileobj(src, dst, length=_COPY_CHUNK)
 
 
 def download_tessdata_from_github_release(
@@ -60,7 +164,9 @@ def download_tessdata_from_github_release(
     _log(log, f"GitHub API: {api_url}")
 
     try:
-        release = _http_get_json(api_url, log=log)
+        release = _http_get_json(
+            api_url, log=log, cache_path=dest_dir / RELEASE_CACHE_FILE
+        )
     except Exception as e:
         return False, f"Failed to query latest release: {type(e).__name__}: {e}"
 
@@ -85,30 +191,50 @@ def download_tessdata_from_github_release(
     _log(log, f"Downloading asset: {asset_name}")
     _log(log, f"URL: {download_url}")
 
-    try:
-        blob = _http_download(download_url, log=log)
-    except Exception as e:
-        return False, f"Failed to download asset: {type(e).__name__}: {e}"
-
-    # Extract zip in-memory
-    try:
-        zf = zipfile.ZipFile(io.BytesIO(blob))
-    except Exception as e:
-        return False, f"Downloaded asset is not a valid zip: {type(e).__name__}: {e}"
-
-    extracted = 0
-    for info in zf.infolist():
-        name = info.filename.replace("\\", "/")
-        if name.endswith("/"):
-            continue
-        # Accept either root files or nested tessdata_best/
-        base = name.split("/")[-1]
-        if base.endswith(".traineddata"):
-            target = dest_dir / base
-            _log(log, f"Extracting: {base} -> {target}")
-            with zf.open(info, "r") as src, target.open("wb") as dst:
-                dst.write(src.read())
-            extracted += 1
+    # Download to an anonymous temp file (removed on close), then extract from it
+    with tempfile.TemporaryFile() as blob:
+        try:
+            _http_download(download_url, blob, log=log)
+            blob.seek(0)
+        except Exception as e:
+            return False, f"Failed to download asset: {type(e).__name__}: {e}"
+
+        try:
+            zf = zipfile.ZipFile(blob)
+        except Exception as e:
+            return (
+                False,
+                f"Downloaded asset is not a valid zip: {type(e).__name__}: {e}",
+            )
+
+        with zf:
+            # base name -> member; a later duplicate wins, as sequential
+            # extraction over the same target would.
+            members: Dict[str, zipfile.ZipInfo] = {}
+            for info in zf.infolist():
+                name = info.filename.replace("\\", "/")
+                if name.endswith("/"):
+                    continue
+                # Accept either root files or nested tessdata_best/
+                base = name.split("/")[-1]
+                if base.endswith(".traineddata"):
+                    members[base] = info
+
+            # Each member goes to its own file and inflate runs outside the GIL,
+            # so extraction overlaps across threads. ZipFile serializes the
+            # underlying reads itself.
+            workers = max(1, min(len(members), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = [
+                    ex.submit(_extract_member, zf, info, dest_dir / base, log)
+                    for base, info in members.items()
+                ]
+                try:
+                    for fut in futures:
+                        fut.result()
+                except Exception as e:
+                    return False, f"Failed to extract: {type(e).__name__}: {e}"
+            extracted = len(members)
 
     if extracted == 0:
         return False, "Zip contains no .traineddata files."
@@ -2,22 +2,73 @@ from __future__ import annotations
 
 import os
 import shutil
+import stat
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Collection, Dict, List, Optional, Sequence, Set, Tuple
 
 from .srt_analyzer import analyze_srt_file
 from .types import LogFn, OCRSettings, Paths, RunResult, Tooling
 
+try:  # optional filesystem watcher (pip install subtitle-ocr-pro[watch])
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = None  # type: ignore[assignment,misc]
+    Observer = None  # type: ignore[assignment,misc]
+
+_READ_CHUNK = 64 * 1024
+# watchdog event types that mean a file was written ("closed" = closed after
+# a write; "closed_no_write"/"opened" are plain reads)
+_WRITE_EVENTS = frozenset({"created", "modified", "moved", "closed"})
+
+# (exe, exe mtime_ns, TESSDATA_PREFIX, lang) -> check_tesseract() result
+_TESS_CACHE: Dict[Tuple[str, int, str, str], Tuple[bool, str]] = {}
+
 
 def check_tesseract(
-    tesseract_exe: Path, tess_lang: str, log: Optional[LogFn] = None
+    tesseract_exe: Path,
+    tess_lang: str,
+    log: Optional[LogFn] = None,
+    tessdata_prefix: Optional[Path] = None,
 ) -> Tuple[bool, str]:
     log = log or (lambda _m: None)
-    if not tesseract_exe.exists():
+    try:
+        st = tesseract_exe.stat()
+    except OSError:
         return False, f"Tesseract executable not found: {tesseract_exe}"
+    # A folder also stats fine, and the tessdata shortcut below never runs it
+    if not stat.S_ISREG(st.st_mode):
+        return False, f"Tesseract executable is not a file: {tesseract_exe}"
+    mtime_ns = st.st_mtime_ns
+
+    missing_msg = (
+        f"WARNING: Tesseract language '{tess_lang}' not present "
+        "(check TESSDATA_PREFIX)."
+    )
+
+    # Known tessdata folder: the answer is just whether <lang>.traineddata
+    # exists there, no need to launch Tesseract.
+    if tessdata_prefix:
+        if (tessdata_prefix / f"{tess_lang}.traineddata").is_file():
+            return True, "Tesseract OK"
+        return True, missing_msg
+
+    # `--list-langs` is a full process launch; its answer only changes when the
+    # binary or the tessdata location does.
+    key = (
+        str(tesseract_exe),
+        mtime_ns,
+        os.environ.get("TESSDATA_PREFIX", ""),
+        tess_lang,
+    )
+    cached = _TESS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     try:
         r = subprocess.run(
             [str(tesseract_exe), "--list-langs"],
@@ -25,40 +76,120 @@ def check_tesseract(
             text=True,
             check=True,
         )
-        if tess_lang not in r.stdout:
-            msg = (
-                f"WARNING: Tesseract language '{tess_lang}' not present "
-                "(check TESSDATA_PREFIX)."
-            )
-            return True, msg
-        return True, "Tesseract OK"
     except Exception as e:
         return False, f"Failed to run Tesseract: {type(e).__name__}: {e}"
 
+    if tess_lang not in r.stdout:
+        result = (True, missing_msg)
+    else:
+        result = (True, "Tesseract OK")
+    _TESS_CACHE[key] = result
+    return result
+
 
 def _snapshot_srt_files(*folders: Path) -> Dict[Path, float]:
     seen: Dict[Path, float] = {}
     for folder in folders:
-        if folder and folder.exists():
-            for p in folder.glob("*.srt"):
-                try:
-                    seen[p.resolve()] = p.stat().st_mtime
-                except OSError:
-                    pass
+        if not folder:
+            continue
+        # Resolve the folder once; entries below it are then already absolute,
+        # so no per-file resolve() (a metadata syscall each on Windows).
+        if not folder.is_absolute():
+            folder = folder.resolve()
+        # os.scandir returns type/stat info with the directory listing
+        # (FindFirstFile/FindNextFile on Windows), avoiding a stat per file.
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if not entry.name.lower().endswith(".srt"):
+                        continue
+                    try:
+                        if entry.is_file():
+                            seen[Path(entry.path)] = entry.stat().st_mtime
+                    except OSError:
+                        pass
+        except OSError:
+            continue
     return seen
 
 
 def _find_new_srt(before: Dict[Path, float], after: Dict[Path, float]) -> List[Path]:
-    new_files: List[Path] = []
-    for p, mtime in after.items():
-        if p not in before:
-            new_files.append(p)
-        elif mtime > before[p] + 0.0001:
-            new_files.append(p)
-    new_files.sort(key=lambda x: x.stat().st_mtime if x.exists() else 0, reverse=True)
+    new_files = [
+        p for p, mtime in after.items() if p not in before or mtime > before[p] + 1e-4
+    ]
+    # The mtime is already in `after`; no need to stat every file again
+    new_files.sort(key=after.__getitem__, reverse=True)
     return new_files
 
 
+class _NewSrtTracker:
+    """Find the .srt files written into `folders` while the tracker is active.
+
+    The folders are listed on entry and again in `new_files`; the diff of the
+    two snapshots is authoritative. With watchdog installed, an observer also
+    records written .srt paths, which catches a rewrite that kept the same
+    mtime (coarse timestamps on FAT/network shares). Nothing is ever written
+    into the watched folders.
+    """
+
+    def __init__(self, folders: Sequence[Path]) -> None:
+        self._folders = folders
+        self._observer = None
+        self._before: Dict[Path, float] = {}
+        self._seen: Set[Path] = set()
+        self._lock = threading.Lock()
+
+    def _on_event(self, event) -> None:
+        # Only writes count: watchdog also reports opened/closed_no_write
+        # (a plain read of an existing .srt), which must not look "new".
+        if event.is_directory or event.event_type not in _WRITE_EVENTS:
+            return
+        path = event.dest_path if event.event_type == "moved" else event.src_path
+        path = os.fsdecode(path)
+        if path.lower().endswith(".srt"):
+            with self._lock:
+                self._seen.add(Path(path))
+
+    def _start_observer(self) -> None:
+        if Observer is None:
+            return
+        handler = FileSystemEventHandler()
+        handler.on_any_event = self._on_event  # type: ignore[method-assign]
+        observer = Observer()
+        try:
+            for folder in self._folders:
+                if folder.is_dir():
+                    observer.schedule(handler, str(folder), recursive=False)
+            observer.start()
+        except Exception:
+            return
+        self._observer = observer
+
+    def __enter__(self) -> "_NewSrtTracker":
+        self._before = _snapshot_srt_files(*self._folders)
+        self._start_observer()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop()
+
+    def _stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def new_files(self) -> List[Path]:
+        """Stop tracking; return new/updated .srt files, newest first."""
+        self._stop()
+        after = _snapshot_srt_files(*self._folders)
+        new = set(_find_new_srt(self._before, after))
+        with self._lock:
+            # Still present (not written then renamed/removed again)
+            new.update(p for p in self._seen if p in after)
+        return sorted(new, key=after.__getitem__, reverse=True)
+
+
 def _inject_path(tooling: Tooling) -> None:
     # Inject tool folders into PATH just for this process
     # (same approach as your scripts)
@@ -66,31 +197,19 @@ def _inject_path(tooling: Tooling) -> None:
     if tooling.mkvtoolnix_dir:
         path_parts.append(str(tooling.mkvtoolnix_dir))
     path_parts.append(str(tooling.tesseract_exe.parent))
-    os.environ["PATH"] = ";".join(path_parts) + ";" + os.environ.get("PATH", "")
+    # Called once per video: drop earlier copies of these folders and put them
+    # first again, so the configured tools always win and PATH (copied into
+    # every pgsrip child) does not keep growing.
+    ours = set(path_parts)
+    current = os.environ.get("PATH", "")
+    rest = [p for p in current.split(os.pathsep) if p not in ours] if current else []
+    os.environ["PATH"] = os.pathsep.join(path_parts + rest)
 
     if tooling.tessdata_prefix:
         os.environ["TESSDATA_PREFIX"] = str(tooling.tessdata_prefix)
 
 
-def process_video(
-    video_path: Path,
-    *,
-    paths: Paths,
-    tooling: Tooling,
-    settings: OCRSettings,
-    log: Optional[LogFn] = None,
-) -> RunResult:
-    log = log or (lambda _m: None)
-    paths.output_dir.mkdir(parents=True, exist_ok=True)
-
-    _inject_path(tooling)
-
-    target_srt = paths.output_dir / f"{video_path.stem}.{settings.pgsrip_lang}.srt"
-    work_dir = video_path.parent.resolve()
-    cwd = Path.cwd().resolve()
-
-    before = _snapshot_srt_files(work_dir, cwd, paths.output_dir)
-
+def _pgsrip_cmd(settings: OCRSettings, inputs: Sequence[Path]) -> List[str]:
     cmd: List[str] = [
         sys.executable,
         "-m",
@@ -110,59 +229,218 @@ def process_video(
         cmd += ["--force"]
     if settings.rip_all:
         cmd += ["--all"]
-    cmd += [str(video_path)]
+    cmd += [str(p) for p in inputs]
+    return cmd
 
-    cmd_str = ' '.join(cmd)
-    log(f"Running: {cmd_str}")
 
-    try:
-        proc = subprocess.Popen(
-            cmd,
-            cwd=str(work_dir),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
-            encoding="utf-8",
-            errors="replace",
-        )
-        assert proc.stdout is not None
-        for line in proc.stdout:
+def _run_pgsrip(cmd: List[str], work_dir: Path, log: LogFn) -> int:
+    log(f"Running: {' '.join(cmd)}")
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(work_dir),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    assert proc.stdout is not None
+    # Binary reads of whatever is available, decoded once per chunk, instead
+    # of line-by-line text-mode iteration. A lone '\r' (progress output) still
+    # counts as a line break, as it did with universal newlines.
+    pending = b""
+    while True:
+        chunk = proc.stdout.read1(_READ_CHUNK)
+        if not chunk:
+            break
+        pending += chunk.replace(b"\r", b"\n")
+        complete, _, pending = pending.rpartition(b"\n")
+        for line in complete.decode("utf-8", "replace").split("\n"):
             if line.strip():
                 log(line.rstrip())
-        rc = proc.wait()
-        if rc != 0:
-            return RunResult(False, f"pgsrip failed (exit code {rc})", {}, None)
+    if pending.strip():
+        log(pending.decode("utf-8", "replace").rstrip())
+    return proc.wait()
+
+
+def _place_srt(chosen: Path, target_srt: Path) -> RunResult:
+    # If pgsrip already wrote into output with our naming, keep it
+    try:
+        same = chosen.samefile(target_srt)
+    except OSError:
+        same = False
+    if same:
+        analysis = analyze_srt_file(chosen)
+        return RunResult(
+            True, f"SRT exists ({analysis.get('status')})", analysis, chosen
+        )
+
+    # Otherwise move/rename to our target
+    if target_srt.exists():
+        target_srt.unlink()
+    shutil.move(str(chosen), str(target_srt))
+
+    analysis = analyze_srt_file(target_srt)
+    return RunResult(
+        True, f"SRT extracted ({analysis.get('status')})", analysis, target_srt
+    )
+
+
+def _matching_srt(
+    video: Path,
+    lang: str,
+    candidates: Sequence[Path],
+    taken: Collection[Path] = (),
+) -> Optional[Path]:
+    """Pick `video`'s subtitle among `candidates` (newest first), or None.
+
+    pgsrip names its output <stem>.<lang>.srt, and that exact name wins.
+    Otherwise <stem>.srt or <stem>.<token>.srt with a single token is
+    accepted, so "Ep1" takes neither "Ep10.en.srt" nor "Ep1.part2.en.srt".
+    """
+    stem = video.stem.lower() + "."
+    exact = f"{stem}{lang.lower()}.srt"
+    loose: Optional[Path] = None
+    for p in candidates:
+        if p in taken:
+            continue
+        name = p.name.lower()
+        if name == exact:
+            return p
+        if loose is None and name.startswith(stem):
+            rest = name[len(stem):]
+            if rest == "srt" or (rest.endswith(".srt") and rest.count(".") == 1):
+                loose = p
+    return loose
+
+
+def _prepare_output(paths: Paths, tooling: Tooling) -> Path:
+    out_dir = paths.output_dir
+    if not out_dir.is_absolute():
+        out_dir = out_dir.resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    _inject_path(tooling)
+    return out_dir
+
+
+def process_video(
+    video_path: Path,
+    *,
+    paths: Paths,
+    tooling: Tooling,
+    settings: OCRSettings,
+    log: Optional[LogFn] = None,
+    strict_match: bool = False,
+) -> RunResult:
+    """Rip one video's subtitle into the output folder.
+
+    With `strict_match`, only this video's own .srt is accepted (see
+    `_matching_srt`), never a fallback candidate. Use it when other videos
+    are being processed concurrently in the same folders, so that a
+    neighbour's fresh output is never picked up.
+    """
+    log = log or (lambda _m: None)
+    out_dir = _prepare_output(paths, tooling)
 
-        time.sleep(0.5)
-        after = _snapshot_srt_files(work_dir, cwd, paths.output_dir)
-        candidates = _find_new_srt(before, after)
+    target_srt = out_dir / f"{video_path.stem}.{settings.pgsrip_lang}.srt"
+    work_dir = video_path.parent
+    if not work_dir.is_absolute():
+        work_dir = work_dir.resolve()
+    # Folders where pgsrip may drop the .srt; the same directory is listed once.
+    srt_folders = tuple(dict.fromkeys((work_dir, Path.cwd(), out_dir)))
+
+    try:
+        with _NewSrtTracker(srt_folders) as tracker:
+            rc = _run_pgsrip(_pgsrip_cmd(settings, [video_path]), work_dir, log)
+            if rc != 0:
+                return RunResult(False, f"pgsrip failed (exit code {rc})", {}, None)
+
+            time.sleep(0.5)
+            candidates = tracker.new_files()
         if not candidates:
             return RunResult(
                 False, "pgsrip finished but no new/updated .srt detected", {}, None
             )
 
-        stem_prefix = video_path.stem.lower()
-        preferred = [p for p in candidates if p.stem.lower().startswith(stem_prefix)]
-        chosen = (preferred[0] if preferred else candidates[0]).resolve()
+        # Snapshot keys are already absolute, no resolve() needed
+        chosen = _matching_srt(video_path, settings.pgsrip_lang, candidates)
+        if chosen is None:
+            if strict_match:
+                return RunResult(
+                    False, "pgsrip finished but no matching .srt detected", {}, None
+                )
+            stem_prefix = video_path.stem.lower()
+            preferred = [
+                p for p in candidates if p.stem.lower().startswith(stem_prefix)
+            ]
+            chosen = preferred[0] if preferred else candidates[0]
+        return _place_srt(chosen, target_srt)
 
-        # If pgsrip already wrote into output with our naming, keep it
-        if chosen == target_srt.resolve():
-            analysis = analyze_srt_file(chosen)
-            return RunResult(
-                True, f"SRT exists ({analysis.get('status')})", analysis, chosen
-            )
+    except Exception as e:
+        return RunResult(False, f"Unexpected error: {type(e).__name__}: {e}", {}, None)
 
-        # Otherwise move/rename to our target
-        if target_srt.exists():
-            target_srt.unlink()
-        shutil.move(str(chosen), str(target_srt))
 
-        analysis = analyze_srt_file(target_srt)
-        return RunResult(
-            True, f"SRT extracted ({analysis.get('status')})", analysis, target_srt
+def process_videos(
+    videos: Sequence[Path],
+    *,
+    paths: Paths,
+    tooling: Tooling,
+    settings: OCRSettings,
+    log: Optional[LogFn] = None,
+) -> List[RunResult]:
+    """Like `process_video`, but one pgsrip process handles a whole folder.
+
+    pgsrip accepts several inputs, so interpreter start-up and imports are
+    paid once per source folder instead of once per video. Results are
+    returned in the order of `videos`.
+    """
+    log = log or (lambda _m: None)
+    out_dir = _prepare_output(paths, tooling)
+
+    # pgsrip runs with the videos' folder as cwd, so batch per folder
+    groups: Dict[Path, List[int]] = {}
+    for i, v in enumerate(videos):
+        work_dir = v.parent
+        if not work_dir.is_absolute():
+            work_dir = work_dir.resolve()
+        groups.setdefault(work_dir, []).append(i)
+
+    results: List[Optional[RunResult]] = [None] * len(videos)
+    for work_dir, idxs in groups.items():
+        batch = [videos[i] for i in idxs]
+        srt_folders = tuple(dict.fromkeys((work_dir, Path.cwd(), out_dir)))
+        try:
+            with _NewSrtTracker(srt_folders) as tracker:
+                rc = _run_pgsrip(_pgsrip_cmd(settings, batch), work_dir, log)
+                time.sleep(0.5)
+                candidates = tracker.new_files()
+        except Exception as e:
+            err = RunResult(
+                False, f"Unexpected error: {type(e).__name__}: {e}", {}, None
+            )
+            for i in idxs:
+                results[i] = err
+            continue
+
+        # A non-zero exit may come from a single bad input: still collect
+        # whatever the other videos produced.
+        missing = (
+            f"pgsrip failed (exit code {rc})"
+            if rc != 0
+            else "pgsrip finished but no new/updated .srt detected"
         )
+        taken: Set[Path] = set()
+        for i in idxs:
+            v = videos[i]
+            chosen = _matching_srt(v, settings.pgsrip_lang, candidates, taken)
+            if chosen is None:
+                results[i] = RunResult(False, missing, {}, None)
+                continue
+            taken.add(chosen)
+            target_srt = out_dir / f"{v.stem}.{settings.pgsrip_lang}.srt"
+            try:
+                results[i] = _place_srt(chosen, target_srt)
+            except Exception as e:
+                results[i] = RunResult(
+                    False, f"Unexpected error: {type(e).__name__}: {e}", {}, None
+                )
 
-    except Exception as e:
-        return RunResult(False, f"Unexpected error: {type(e).__name__}: {e}", {}, None)
+    return [r for r in results if r is not None]
@@ -1,16 +1,46 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import List, Sequence, Set
+from typing import FrozenSet, Iterator, List, Optional, Sequence, Tuple
 
-VIDEO_EXTS: Set[str] = {".mkv", ".mp4", ".m4v", ".ts"}
+VIDEO_EXTS: FrozenSet[str] = frozenset({".mkv", ".mp4", ".m4v", ".ts"})
+# Lower-cased, as a tuple for str.endswith()
+_VIDEO_SUFFIXES: Tuple[str, ...] = tuple(VIDEO_EXTS)
+
+
+def _video_entries(folder: Path, exts: Sequence[str] | None) -> Iterator[os.DirEntry]:
+    """Yield the scandir entries of the video files directly in `folder`."""
+    if not folder.is_absolute():
+        folder = folder.resolve()
+    suffixes = tuple(e.lower() for e in exts) if exts else _VIDEO_SUFFIXES
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                if e.name.lower().endswith(suffixes) and e.is_file():
+                    yield e
+    except FileNotFoundError:
+        return
+
+
+def scan_video_entries(
+    folder: Path, exts: Sequence[str] | None = None
+) -> List[Tuple[Path, Optional[int]]]:
+    """Like `scan_videos`, but each path comes with its size in bytes.
+
+    The size is read from the scandir entry (free on Windows, where the
+    directory listing already carries it); None if it cannot be read.
+    """
+    found: List[Tuple[Path, Optional[int]]] = []
+    for e in _video_entries(folder, exts):
+        try:
+            size: Optional[int] = e.stat().st_size
+        except OSError:
+            size = None
+        found.append((Path(e.path), size))
+    found.sort(key=lambda row: row[0])
+    return found
 
 
 def scan_videos(folder: Path, exts: Sequence[str] | None = None) -> List[Path]:
-    folder = folder.resolve()
-    use_exts = set(e.lower() for e in (exts or VIDEO_EXTS))
-    if not folder.exists():
-        return []
-    return sorted(
-        [p for p in folder.iterdir() if p.is_file() and p.suffix.lower() in use_exts]
-    )
+    return sorted(Path(e.path) for e in _video_entries(folder, exts))
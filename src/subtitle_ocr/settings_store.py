@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:  # optional C JSON codec (pip install subtitle-ocr-pro[fast])
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 APP_NAME = "subtitle-ocr-pro"
 SETTINGS_FILE = "settings.json"
@@ -25,7 +30,7 @@ def settings_path(custom_dir: Optional[Path] = None) -> Path:
     return base / SETTINGS_FILE
 
 
-@dataclass
+@dataclass(frozen=True)
 class GUISettings:
     input_dir: str = ""
     output_dir: str = ""
@@ -43,25 +48,43 @@ class GUISettings:
     keep_temp: bool = False
 
 
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    # Both paths produce the same bytes: UTF-8, 2-space indent.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def load_settings(path: Optional[Path] = None) -> GUISettings:
     p = path if path else settings_path()
     if not p.exists():
         return GUISettings()
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
+        data = _json_loads(p.read_bytes())
         # Only accept known keys
-        obj = GUISettings()
-        for k, v in data.items():
-            if hasattr(obj, k):
-                setattr(obj, k, v)
-        return obj
+        known = {f.name for f in fields(GUISettings)}
+        return GUISettings(**{k: v for k, v in data.items() if k in known})
     except Exception:
         return GUISettings()
 
 
 def save_settings(settings: GUISettings, path: Optional[Path] = None) -> Path:
     p = path if path else settings_path()
-    p.write_text(
-        json.dumps(asdict(settings), indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    new = _json_dumps(asdict(settings))
+    try:
+        if p.read_bytes() == new:
+            return p  # unchanged: skip the write entirely
+    except OSError:
+        pass
+    # Write a sibling temp file and swap it in, so a crash mid-write never
+    # leaves a truncated settings.json behind.
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_bytes(new)
+    os.replace(tmp, p)
     return p
@@ -1,9 +1,51 @@
 from __future__ import annotations
 
+import bisect
+import codecs
+import io
+import os
 import re
 from pathlib import Path
 from typing import Any, Dict
 
+# Precompiled once at import; analyze_srt_file is called for every produced SRT.
+# Patterns are applied per line (see the single streaming pass below). Sequence
+# counters are recognised with str.isdecimal(), which matches what
+# r"^\s*\d+\s*\Z" would on the stripped line without entering the regex engine.
+_TIME_RE = re.compile(r"\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}")
+_TS_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})")
+
+_SNIFF_BYTES = 4096
+
+# Status by subtitle count: below 5, below 20, below 50, below 100, the rest.
+_STATUS_THRESHOLDS = (5, 20, 50, 100)
+_STATUS_LABELS = (
+    "PUȚINE SUBS ⚠️",
+    "MEDIU ✓",
+    "BUN ✓",
+    "FOARTE BUN ✓",
+    "EXCELENT ✓",
+)
+
+
+def _sniff_encoding(head: bytes) -> str:
+    """Pick a decoder from the first bytes of the file.
+
+    A BOM wins; otherwise UTF-8 if the head decodes cleanly (an incomplete
+    trailing sequence is fine), else latin-1, which accepts any byte.
+    """
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+        return "utf-32"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8"
+
 
 def analyze_srt_file(srt_path: Path) -> Dict[str, Any]:
     """Analyze an SRT file and return a quality/content heuristic.
@@ -23,51 +65,68 @@ def analyze_srt_file(srt_path: Path) -> Dict[str, Any]:
         "has_content": False,
     }
 
-    if not srt_path.exists():
+    # One open for everything: size via fstat, encoding sniffed from the head,
+    # then the same handle is decoded while streaming.
+    try:
+        fh = srt_path.open("rb")
+    except FileNotFoundError:
         analysis["status"] = "MISSING ❌"
         return analysis
+    except Exception as e:
+        analysis["status"] = f"READ ERROR: {type(e).__name__}"
+        return analysis
 
-    # --- read file (utf-8 first, then fallback) ---
-    content: str
+    time_re = _TIME_RE
+    ts_re = _TS_RE
+
+    n_lines = 0
+    empty_lines = 0
+    subtitles = 0
+    time_sequences = 0
+    text_len = 0
+    text_n = 0
+    last_ts = None
+
+    # --- single streaming pass ---
     try:
-        content = srt_path.read_text(encoding="utf-8", errors="ignore")
-    except UnicodeDecodeError:
-        try:
-            content = srt_path.read_text(encoding="latin-1", errors="ignore")
-            analysis["status"] = "LATIN-1 ENCODING"
-        except Exception as e:
-            analysis["status"] = f"READ ERROR: {type(e).__name__}"
-            return analysis
+        with fh:
+            analysis["size"] = os.fstat(fh.fileno()).st_size
+            if analysis["size"] == 0:
+                analysis["status"] = "EMPTY ❌"
+                return analysis
+
+            encoding = _sniff_encoding(fh.read(_SNIFF_BYTES))
+            fh.seek(0)
+            with io.TextIOWrapper(fh, encoding=encoding, errors="ignore") as text:
+                for line in text:
+                    n_lines += 1
+                    stripped = line.strip()
+                    if not stripped:
+                        empty_lines += 1
+                    elif stripped.isdecimal():
+                        # 1) sequence counters
+                        subtitles += 1
+                    elif "-->" in line and time_re.search(line):
+                        # 2) time sequences (00:00:00,000 --> 00:00:02,000)
+                        time_sequences += 1
+                        ts = ts_re.findall(line)
+                        if ts:
+                            last_ts = ts[-1]
+                    else:
+                        # 3) subtitle text lines (for the rough average length)
+                        text_len += len(stripped)
+                        text_n += 1
     except Exception as e:
         analysis["status"] = f"READ ERROR: {type(e).__name__}"
         return analysis
 
     try:
-        analysis["size"] = srt_path.stat().st_size
-        if analysis["size"] == 0:
-            analysis["status"] = "EMPTY ❌"
-            return analysis
-
-        lines = content.splitlines()
-        analysis["lines"] = len(lines)
-        analysis["empty_lines"] = sum(1 for ln in lines if not ln.strip())
-
-        # 1) sequence counters
-        seq_pattern = r"^\s*\d+\s*$"
-        analysis["subtitles"] = len(re.findall(seq_pattern, content, re.MULTILINE))
-
-        # 2) time sequences (00:00:00,000 --> 00:00:02,000)
-        time_pattern = r"\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}"
-        analysis["time_sequences"] = len(re.findall(time_pattern, content))
-
-        # 3) average subtitle line length (rough)
-        text_content = re.sub(seq_pattern, "", content, flags=re.MULTILINE)
-        text_content = re.sub(time_pattern, "", text_content)
-        text_lines = [ln.strip() for ln in text_content.splitlines() if ln.strip()]
-        if text_lines:
-            analysis["avg_subtitle_length"] = sum(len(ln) for ln in text_lines) / float(
-                len(text_lines)
-            )
+        analysis["lines"] = n_lines
+        analysis["empty_lines"] = empty_lines
+        analysis["subtitles"] = subtitles
+        analysis["time_sequences"] = time_sequences
+        if text_n:
+            analysis["avg_subtitle_length"] = text_len / float(text_n)
 
         analysis["has_content"] = (
             analysis["subtitles"] > 0 and analysis["time_sequences"] > 0
@@ -75,10 +134,8 @@ def analyze_srt_file(srt_path: Path) -> Dict[str, Any]:
 
         # 4) best-effort duration estimation from last timestamp
         #    NOTE: this is heuristic; we keep it conservative.
-        ts_pat = r"(\d{2}):(\d{2}):(\d{2}),(\d{3})"
-        ts = re.findall(ts_pat, content)
-        if ts:
-            hh, mm, ss, ms = ts[-1]
+        if last_ts:
+            hh, mm, ss, ms = last_ts
             analysis["duration_seconds"] = (
                 int(hh) * 3600 + int(mm) * 60 + int(ss) + (int(ms) / 1000.0)
             )
@@ -88,16 +145,9 @@ def analyze_srt_file(srt_path: Path) -> Dict[str, Any]:
             analysis["status"] = "FOARTE MIC ⚠️"
         elif analysis["subtitles"] == 0 and analysis["time_sequences"] == 0:
             analysis["status"] = "FĂRĂ SUBS ❌"
-        elif analysis["subtitles"] < 5:
-            analysis["status"] = "PUȚINE SUBS ⚠️"
-        elif analysis["subtitles"] < 20:
-            analysis["status"] = "MEDIU ✓"
-        elif analysis["subtitles"] < 50:
-            analysis["status"] = "BUN ✓"
-        elif analysis["subtitles"] < 100:
-            analysis["status"] = "FOARTE BUN ✓"
         else:
-            analysis["status"] = "EXCELENT ✓"
+            idx = bisect.bisect_right(_STATUS_THRESHOLDS, analysis["subtitles"])
+            analysis["status"] = _STATUS_LABELS[idx]
 
         # Inconsistency check between sequences and timings
         if analysis["subtitles"] > 0 and analysis["time_sequences"] > 0:
@@ -4,7 +4,7 @@ import argparse
 from pathlib import Path
 
 from subtitle_ocr.config import ensure_dirs, load_defaults
-from subtitle_ocr.pipeline import check_tesseract, process_video
+from subtitle_ocr.pipeline import check_tesseract, process_videos
 from subtitle_ocr.scanner import scan_videos
 from subtitle_ocr.types import OCRSettings, Paths, Tooling
 
@@ -54,7 +54,11 @@ def main() -> int:
         keep_temp=args.keep_temp,
     )
 
-    ok, msg = check_tesseract(tooling.tesseract_exe, settings.tess_lang)
+    ok, msg = check_tesseract(
+        tooling.tesseract_exe,
+        settings.tess_lang,
+        tessdata_prefix=tooling.tessdata_prefix,
+    )
     print(msg)
     if not ok:
         return 2
@@ -64,11 +68,13 @@ def main() -> int:
         print(f"No videos found in {paths.input_dir}")
         return 0
 
+    # One pgsrip run for the whole batch instead of one per video
+    results = process_videos(
+        videos, paths=paths, tooling=tooling, settings=settings, log=print
+    )
     succ = 0
-    for v in videos:
-        res = process_video(
-            v, paths=paths, tooling=tooling, settings=settings, log=print
-        )
+    for v, res in zip(videos, results):
+        print(f"{v.name}: {'OK' if res.success else 'FAIL'} | {res.message}")
         succ += 1 if res.success else 0
     print(f"Done: {succ}/{len(videos)} succeeded.")
     return 0
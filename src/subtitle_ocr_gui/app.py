@@ -1,16 +1,20 @@
-import csv
-import json
+import functools
+import os
+import queue
 import threading
+import time
 import tkinter as tk
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from tkinter import filedialog, messagebox, scrolledtext, ttk
-from typing import Any, Dict, List, Optional
+from tkinter import ttk
+from typing import Any, Dict, List, Optional, Tuple
 
 from subtitle_ocr.config import ensure_dirs, load_defaults
 from subtitle_ocr.models_downloader import download_tessdata_from_github_release
 from subtitle_ocr.pipeline import check_tesseract, process_video
-from subtitle_ocr.scanner import scan_videos
+from subtitle_ocr.scanner import scan_video_entries
 from subtitle_ocr.settings_store import (
     GUISettings,
     load_settings,
@@ -28,6 +32,82 @@ GITHUB_OWNER = "ProXtech-pro"
 GITHUB_REPO = "Subtitle_ocr"
 GITHUB_ASSET_NAME = "tessdata_best_min.zip"
 
+# Log lines are queued (from any thread) and flushed into the widget in batches
+LOG_FLUSH_MS = 100
+LOG_MAX_BATCH = 500
+# Settings changes within this window are persisted once
+SAVE_DEBOUNCE_MS = 500
+MB = 1 << 20
+
+
+# Environment for OCR worker processes: N single-threaded Tesseracts scale
+# better than N Tesseracts each spawning one OpenMP thread per core.
+OCR_WORKER_ENV = {"OMP_THREAD_LIMIT": "1"}
+
+# Set in each OCR worker process by _init_ocr_worker
+_worker_log_queue: Any = None
+
+# (epoch of the current local hour, "HH:") for _timestamp
+_hour_cache: Tuple[int, str] = (0, "")
+
+
+def _timestamp() -> str:
+    """Local "HH:MM:SS"; localtime() only runs once the hour rolls over."""
+    global _hour_cache
+    now = int(time.time())
+    start, prefix = _hour_cache
+    if not 0 <= now - start < 3600:
+        lt = time.localtime(now)
+        start = now - lt.tm_min * 60 - lt.tm_sec
+        prefix = f"{lt.tm_hour:02d}:"
+        _hour_cache = (start, prefix)
+    m, sec = divmod(now - start, 60)
+    return f"{prefix}{m:02d}:{sec:02d}"
+
+
+def _format_row(p: Path, size: Optional[int]) -> str:
+    if size is None:
+        return p.name
+    return f"{p.name} ({size / MB:.1f} MB)"
+
+
+def _dir_mtime_ns(p: Path) -> Optional[int]:
+    try:
+        st = p.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns
+
+
+@functools.lru_cache(maxsize=64)
+def _file_present(folder: str, name: str, dir_mtime_ns: int) -> bool:
+    # Adding/removing a file bumps the folder mtime, which is part of the key
+    return os.path.exists(os.path.join(folder, name))
+
+
+def _init_ocr_worker(log_queue: Any, env: Dict[str, str]) -> None:
+    global _worker_log_queue
+    _worker_log_queue = log_queue
+    for key, value in env.items():
+        os.environ.setdefault(key, value)
+
+
+def _process_video_in_worker(
+    video: Path, paths: Paths, tooling: Tooling, settings: OCRSettings
+) -> RunResult:
+    def log(msg: str) -> None:
+        _worker_log_queue.put(f"[{video.name}] {msg}")
+
+    # Other workers may be writing .srt files into the same folders
+    return process_video(
+        video,
+        paths=paths,
+        tooling=tooling,
+        settings=settings,
+        log=log,
+        strict_match=True,
+    )
+
 
 class App:
     def __init__(self, root: tk.Tk) -> None:
@@ -70,11 +150,33 @@ class App:
         self.keep_temp = tk.BooleanVar(value=bool(persisted.keep_temp))
 
         self.all_files: List[Path] = []
+        # Listbox text for each entry of all_files (same order)
+        self._file_labels: List[str] = []
         self.processing = False
         self.stop_requested = False
-        self._run_results: List[Dict[str, Any]] = []
+        self._clear_results()
+        self._log_queue: "queue.Queue[str]" = queue.Queue()
+        self._scan_executor = ThreadPoolExecutor(max_workers=1)
+        # Settings are written off the Tk thread, and only when they changed
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._last_saved_settings: Optional[GUISettings] = None
+        self._save_after_id: Optional[str] = None
+        # (op, raw string) -> Path; cleared whenever a path field is edited
+        self._path_cache: Dict[Tuple[str, str], Path] = {}
+        self._worker_env_logged = False
+        for var in (
+            self.input_dir,
+            self.output_dir,
+            self.log_dir,
+            self.tess_exe,
+            self.mkv_dir,
+            self.tessdata_prefix,
+        ):
+            var.trace_add("write", lambda *_: self._path_cache.clear())
 
         self._build()
+        self.root.after(LOG_FLUSH_MS, self._drain_log)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _current_gui_settings(self) -> GUISettings:
         return GUISettings(
@@ -94,11 +196,33 @@ class App:
             keep_temp=bool(self.keep_temp.get()),
         )
 
+    def _schedule_save(self, delay_ms: int = SAVE_DEBOUNCE_MS) -> None:
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(delay_ms, self._save_settings_now)
+
     def _save_settings_now(self) -> None:
-        p = save_settings(self._current_gui_settings())
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        s = self._current_gui_settings()
+        if s == self._last_saved_settings:
+            return
+        self._last_saved_settings = s
+        self._save_executor.submit(self._save_settings_worker, s)
+
+    def _save_settings_worker(self, s: GUISettings) -> None:
+        try:
+            p = save_settings(s)
+        except Exception as e:
+            self._last_saved_settings = None
+            self._log(f"Failed to save settings: {type(e).__name__}: {e}")
+            return
         self._log(f"Saved settings to: {p}")
 
     def _build(self) -> None:
+        from tkinter import scrolledtext
+
         main = ttk.Frame(self.root, padding=10)
         main.grid(row=0, column=0, sticky="nsew")
         self.root.columnconfigure(0, weight=1)
@@ -116,9 +240,8 @@ class App:
         ttk.Button(dir_frame, text="Browse", command=self._browse_input).grid(
             row=0, column=2, padx=4
         )
-        ttk.Button(dir_frame, text="Scan", command=self.scan).grid(
-            row=0, column=3, padx=4
-        )
+        self.scan_btn = ttk.Button(dir_frame, text="Scan", command=self.scan)
+        self.scan_btn.grid(row=0, column=3, padx=4)
 
         ttk.Label(dir_frame, text="Output:").grid(
             row=1, column=0, sticky="w", pady=(6, 0)
@@ -284,72 +407,119 @@ class App:
         )
 
     def _log(self, msg: str) -> None:
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.log.configure(state="normal")
-        self.log.insert(tk.END, f"[{ts}] {msg}\n")
-        self.log.see(tk.END)
-        self.log.configure(state="disabled")
-        self.root.update_idletasks()
+        # Safe from worker threads: only the Tk thread touches the widget
+        self._log_queue.put(f"[{_timestamp()}] {msg}\n")
+
+    def _drain_log(self) -> None:
+        batch: List[str] = []
+        try:
+            while len(batch) < LOG_MAX_BATCH:
+                batch.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if batch:
+            self.log.configure(state="normal")
+            self.log.insert(tk.END, "".join(batch))
+            self.log.see(tk.END)
+            self.log.configure(state="disabled")
+        # Backlog left: come back right away instead of waiting a full period
+        delay = 1 if len(batch) == LOG_MAX_BATCH else LOG_FLUSH_MS
+        self.root.after(delay, self._drain_log)
 
     def _browse_input(self) -> None:
+        from tkinter import filedialog
+
         p = filedialog.askdirectory()
         if p:
             self.input_dir.set(p)
-            self._save_settings_now()
+            self._schedule_save()
 
     def _browse_output(self) -> None:
+        from tkinter import filedialog
+
         p = filedialog.askdirectory()
         if p:
             self.output_dir.set(p)
-            self._save_settings_now()
+            self._schedule_save()
 
     def _browse_logs(self) -> None:
+        from tkinter import filedialog
+
         p = filedialog.askdirectory()
         if p:
             self.log_dir.set(p)
-            self._save_settings_now()
+            self._schedule_save()
 
     def scan(self) -> None:
+        # Listing and stat() run off the Tk thread; results come back via after()
         folder = Path(self.input_dir.get()).resolve()
-        self.all_files = scan_videos(folder)
+        self.scan_btn.configure(state="disabled")
+        self._scan_executor.submit(self._scan_worker, folder)
+
+    def _scan_worker(self, folder: Path) -> None:
+        try:
+            rows = scan_video_entries(folder)
+            files = [p for p, _size in rows]
+            labels = [_format_row(p, size) for p, size in rows]
+        except Exception as e:
+            self._log(f"Scan failed: {type(e).__name__}: {e}")
+            files, labels = [], []
+        self.root.after(0, lambda f=files, lb=labels: self._populate_listbox(f, lb))
+
+    def _populate_listbox(self, files: List[Path], labels: List[str]) -> None:
+        self.all_files = files
+        self._file_labels = labels
         self.listbox.delete(0, tk.END)
-        for p in self.all_files:
-            try:
-                size_mb = p.stat().st_size / (1024 * 1024)
-                self.listbox.insert(tk.END, f"{p.name} ({size_mb:.1f} MB)")
-            except OSError:
-                self.listbox.insert(tk.END, f"{p.name}")
+        if labels:
+            # One Tcl call for the whole list
+            self.listbox.insert(tk.END, *labels)
         self._log(f"Found {len(self.all_files)} video file(s).")
-        self._save_settings_now()
+        self.scan_btn.configure(state="normal")
+        self._schedule_save()
 
     def clear_files(self) -> None:
         self.all_files = []
+        self._file_labels = []
         self.listbox.delete(0, tk.END)
 
     def remove_selected(self) -> None:
-        idxs = list(self.listbox.curselection())
-        if not idxs:
+        drop = set(self.listbox.curselection())
+        if not drop:
             return
-        for i in sorted(idxs, reverse=True):
-            self.all_files.pop(i)
-            self.listbox.delete(i)
+        # Rebuild in one pass and refill the listbox with a single Tcl call
+        keep = [i for i in range(len(self.all_files)) if i not in drop]
+        self.all_files = [self.all_files[i] for i in keep]
+        self._file_labels = [self._file_labels[i] for i in keep]
+        self.listbox.delete(0, tk.END)
+        if self._file_labels:
+            self.listbox.insert(tk.END, *self._file_labels)
+
+    def _cached_path(self, op: str, raw: str) -> Path:
+        # resolve() goes to the filesystem (slow on network drives), so each
+        # field value is converted once until it is edited again.
+        key = (op, raw)
+        p = self._path_cache.get(key)
+        if p is None:
+            p = Path(raw).resolve() if op == "resolve" else Path(raw).expanduser()
+            self._path_cache[key] = p
+        return p
 
     def _current_paths_tooling_settings(self):
         paths = Paths(
-            input_dir=Path(self.input_dir.get()).resolve(),
-            output_dir=Path(self.output_dir.get()).resolve(),
-            log_dir=Path(self.log_dir.get()).resolve(),
+            input_dir=self._cached_path("resolve", self.input_dir.get()),
+            output_dir=self._cached_path("resolve", self.output_dir.get()),
+            log_dir=self._cached_path("resolve", self.log_dir.get()),
         )
+        mkv_dir = self.mkv_dir.get()
+        tessdata_prefix = self.tessdata_prefix.get()
         tooling = Tooling(
-            tesseract_exe=Path(self.tess_exe.get()).expanduser(),
+            tesseract_exe=self._cached_path("expand", self.tess_exe.get()),
             mkvtoolnix_dir=(
-                Path(self.mkv_dir.get()).expanduser()
-                if self.mkv_dir.get().strip()
-                else None
+                self._cached_path("expand", mkv_dir) if mkv_dir.strip() else None
             ),
             tessdata_prefix=(
-                Path(self.tessdata_prefix.get()).expanduser()
-                if self.tessdata_prefix.get().strip()
+                self._cached_path("expand", tessdata_prefix)
+                if tessdata_prefix.strip()
                 else None
             ),
         )
@@ -373,11 +543,13 @@ class App:
                 "mkvmerge.exe / mkvextract.exe.\n"
                 "Set MKVTOOLNIX_DIR in .env or in the GUI."
             )
-        if not mkv_dir.exists():
+        mtime = _dir_mtime_ns(mkv_dir)
+        if mtime is None:
             return f"MKVToolNix folder does not exist: {mkv_dir}"
-        mkvmerge = mkv_dir / "mkvmerge.exe"
-        mkvextract = mkv_dir / "mkvextract.exe"
-        if not mkvmerge.exists() and not mkvextract.exists():
+        folder = str(mkv_dir)
+        if not _file_present(folder, "mkvmerge.exe", mtime) and not _file_present(
+            folder, "mkvextract.exe", mtime
+        ):
             return (
                 f"MKVToolNix folder looks invalid: {mkv_dir}\n"
                 "Expected mkvmerge.exe and/or mkvextract.exe inside that directory."
@@ -393,14 +565,12 @@ class App:
                 "Set TESSDATA_PREFIX=tessdata_best (project-local) and place "
                 "traineddata files there."
             )
-        if not tessdata.exists():
+        mtime = _dir_mtime_ns(tessdata)
+        if mtime is None:
             return f"TESSDATA_PREFIX folder does not exist: {tessdata}"
         lang_code = tess_lang.strip()
-        required = TESS_TRAINEDDATA_MAP.get(
-            lang_code,
-            f"{lang_code}.traineddata",
-        )
-        if not (tessdata / required).exists():
+        required = TESS_TRAINEDDATA_MAP.get(lang_code) or f"{lang_code}.traineddata"
+        if not _file_present(str(tessdata), required, mtime):
             msg = (
                 f"Missing traineddata for TESS_LANG='{tess_lang}': "
                 f"expected {required} in\n"
@@ -412,10 +582,15 @@ class App:
         return None
 
     def check_setup(self) -> None:
+        from tkinter import messagebox
+
         _paths, tooling, settings = self._current_paths_tooling_settings()
 
         ok, tmsg = check_tesseract(
-            tooling.tesseract_exe, settings.tess_lang, log=self._log
+            tooling.tesseract_exe,
+            settings.tess_lang,
+            log=self._log,
+            tessdata_prefix=tooling.tessdata_prefix,
         )
         problems = []
         if not ok:
@@ -443,6 +618,8 @@ class App:
         Download tessdata_best traineddata files from GitHub Releases (latest),
         and place them into project-local ./tessdata_best
         """
+        from tkinter import messagebox
+
         dest_dir = (
             Path(self.tessdata_prefix.get()).resolve()
             if self.tessdata_prefix.get().strip()
@@ -468,27 +645,38 @@ class App:
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _clear_results(self) -> None:
+        # Run results are kept column-wise, one list per field (same length)
+        self._res_video: List[Path] = []
+        self._res_success: List[bool] = []
+        self._res_message: List[str] = []
+        self._res_analysis: List[Dict[str, Any]] = []
+        self._res_output_srt: List[Any] = []
+
     def _record_result(self, video: Path, res: RunResult) -> None:
-        self._run_results.append(
-            {
-                "video": str(video),
-                "success": bool(res.success),
-                "message": res.message,
-                "analysis": res.analysis or {},
-                "output_srt": str(res.output_srt) if res.output_srt else "",
-            }
-        )
+        # Paths stay as-is; the exporters stringify them
+        self._res_video.append(video)
+        self._res_success.append(res.success)
+        self._res_message.append(res.message)
+        self._res_analysis.append(res.analysis or {})
+        self._res_output_srt.append(res.output_srt or "")
 
     def show_summary(self) -> None:
-        if not self._run_results:
+        from tkinter import messagebox
+
+        if not self._res_video:
             messagebox.showinfo("Summary", "No run results yet.")
             return
 
-        total = len(self._run_results)
-        succ = sum(1 for r in self._run_results if r.get("success"))
+        total = len(self._res_video)
+        succ = sum(self._res_success)
         fail = total - succ
 
-        failures = [r for r in self._run_results if not r.get("success")]
+        failures = [
+            (v, m)
+            for v, ok, m in zip(self._res_video, self._res_success, self._res_message)
+            if not ok
+        ]
         lines: List[str] = []
         lines.append(f"Total: {total}")
         lines.append(f"Success: {succ}")
@@ -496,9 +684,8 @@ class App:
         lines.append("")
         if failures:
             lines.append("Failures:")
-            for r in failures[:10]:
-                v = Path(r["video"]).name
-                lines.append(f"- {v}: {r.get('message')}")
+            for v, m in failures[:10]:
+                lines.append(f"- {v.name}: {m}")
             if len(failures) > 10:
                 lines.append(f"... and {len(failures) - 10} more")
         else:
@@ -507,7 +694,9 @@ class App:
         messagebox.showinfo("Run summary", "\n".join(lines))
 
     def export_report(self) -> None:
-        if not self._run_results:
+        from tkinter import filedialog, messagebox
+
+        if not self._res_video:
             messagebox.showwarning("Export", "No run results to export yet.")
             return
 
@@ -533,16 +722,52 @@ class App:
             messagebox.showerror("Export failed", f"{type(e).__name__}: {e}")
 
     def _export_json(self, out: Path) -> None:
+        import json
+
+        # Optional C JSON codec (None without the [fast] extra)
+        from subtitle_ocr.settings_store import orjson
+
         payload = {
             "generated_at": datetime.now().isoformat(timespec="seconds"),
-            "results": self._run_results,
+            # The report keeps one object per video
+            "results": [
+                {
+                    "video": v,
+                    "success": ok,
+                    "message": m,
+                    "analysis": a,
+                    "output_srt": o,
+                }
+                for v, ok, m, a, o in zip(
+                    self._res_video,
+                    self._res_success,
+                    self._res_message,
+                    self._res_analysis,
+                    self._res_output_srt,
+                )
+            ],
         }
-        out.write_text(
-            json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        # Serialize straight into the file instead of building one big str
+        # Platform line endings in both branches, as Path.write_text gave
+        if orjson is not None:
+            data = orjson.dumps(
+                payload,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+            if os.linesep != "\n":
+                # Safe: newlines inside JSON strings are escaped
+                data = data.replace(b"\n", os.linesep.encode())
+            with out.open("wb") as f:
+                f.write(data)
+            return
+        with out.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False, default=str)
 
     def _export_csv(self, out: Path) -> None:
-        fieldnames = [
+        import csv
+
+        fieldnames = (
             "video",
             "success",
             "message",
@@ -555,29 +780,38 @@ class App:
             "empty_lines",
             "avg_subtitle_length",
             "duration_seconds",
-        ]
-        with out.open("w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=fieldnames)
-            w.writeheader()
-            for r in self._run_results:
-                a = r.get("analysis") or {}
-                row = {
-                    "video": r.get("video", ""),
-                    "success": r.get("success", False),
-                    "message": r.get("message", ""),
-                    "output_srt": r.get("output_srt", ""),
-                    "status": a.get("status", ""),
-                    "size": a.get("size", ""),
-                    "lines": a.get("lines", ""),
-                    "subtitles": a.get("subtitles", ""),
-                    "time_sequences": a.get("time_sequences", ""),
-                    "empty_lines": a.get("empty_lines", ""),
-                    "avg_subtitle_length": a.get("avg_subtitle_length", ""),
-                    "duration_seconds": a.get("duration_seconds", ""),
-                }
-                w.writerow(row)
+        )
+        with out.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            w = csv.writer(f)
+            w.writerow(fieldnames)
+            # Rows as tuples in fieldnames order (no per-row dict for DictWriter)
+            for v, ok, m, o, a in zip(
+                self._res_video,
+                self._res_success,
+                self._res_message,
+                self._res_output_srt,
+                self._res_analysis,
+            ):
+                w.writerow(
+                    (
+                        v,
+                        ok,
+                        m,
+                        o,
+                        a.get("status", ""),
+                        a.get("size", ""),
+                        a.get("lines", ""),
+                        a.get("subtitles", ""),
+                        a.get("time_sequences", ""),
+                        a.get("empty_lines", ""),
+                        a.get("avg_subtitle_length", ""),
+                        a.get("duration_seconds", ""),
+                    )
+                )
 
     def start(self) -> None:
+        from tkinter import messagebox
+
         if self.processing:
             return
         if not self.all_files:
@@ -599,7 +833,7 @@ class App:
             return
 
         self._save_settings_now()
-        self._run_results = []
+        self._clear_results()
 
         self.processing = True
         self.stop_requested = False
@@ -607,31 +841,122 @@ class App:
         self.stop_btn.configure(state="normal")
         self.progress["value"] = 0
 
+        videos = list(self.all_files)
+
         def worker():
-            total = len(self.all_files)
+            total = len(videos)
+            jobs = max(1, min(settings.max_workers or 1, total))
             ok_count = 0
+            log_queue: Any = None
+            forwarder: Optional[threading.Thread] = None
+            stopping = False
+            pool: Any
+
+            # Inherited by every pgsrip/Tesseract child (threaded path too);
+            # a value the user already exported wins.
+            for key, value in OCR_WORKER_ENV.items():
+                os.environ.setdefault(key, value)
+            if not self._worker_env_logged:
+                self._worker_env_logged = True
+                self._log(f"OMP_THREAD_LIMIT={os.environ['OMP_THREAD_LIMIT']}")
+
+            if jobs == 1:
+                pool = ThreadPoolExecutor(max_workers=1)
+
+                def submit(vp: Path) -> Future:
+                    return pool.submit(
+                        process_video,
+                        vp,
+                        paths=paths,
+                        tooling=tooling,
+                        settings=settings,
+                        log=self._log,
+                    )
 
-            for i, vp in enumerate(self.all_files, start=1):
-                if self.stop_requested:
-                    self._log("Stop requested.")
-                    break
+            else:
+                # Only needed for parallel runs; kept out of GUI start-up
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
 
-                self._log(f"=== [{i}/{total}] {vp.name} ===")
-                res = process_video(
-                    vp, paths=paths, tooling=tooling, settings=settings, log=self._log
+                # Split the pgsrip worker budget between the parallel videos
+                job_settings = replace(
+                    settings, max_workers=max(1, (settings.max_workers or 1) // jobs)
+                )
+                log_queue = multiprocessing.Queue()
+                forwarder = threading.Thread(
+                    target=self._forward_worker_logs, args=(log_queue,), daemon=True
+                )
+                forwarder.start()
+                pool = ProcessPoolExecutor(
+                    max_workers=jobs,
+                    initializer=_init_ocr_worker,
+                    initargs=(log_queue, OCR_WORKER_ENV),
                 )
-                self._record_result(vp, res)
-
-                self._log(f"Result: {'OK' if res.success else 'FAIL'} | {res.message}")
-                if res.output_srt:
-                    self._log(f"Output: {res.output_srt}")
-                if res.analysis:
-                    self._log(f"Analysis: {res.analysis}")
 
-                if res.success:
-                    ok_count += 1
+                def submit(vp: Path) -> Future:
+                    return pool.submit(
+                        _process_video_in_worker, vp, paths, tooling, job_settings
+                    )
+
+            self._log(f"Processing {total} video(s) with {jobs} parallel job(s).")
+
+            # A video is handed to the pool only when a slot is free, so once
+            # Stop is pressed nothing new starts (no queued work to cancel).
+            pending = iter(enumerate(videos, start=1))
+            running: Dict[Future, Path] = {}
+
+            def fill() -> None:
+                while len(running) < jobs and not self.stop_requested:
+                    nxt = next(pending, None)
+                    if nxt is None:
+                        return
+                    i, vp = nxt
+                    self._log(f"=== [{i}/{total}] {vp.name} ===")
+                    running[submit(vp)] = vp
+
+            done = 0
+            last_pct = 0
+            fill()
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    vp = running.pop(fut)
+                    done += 1
+                    try:
+                        res = fut.result()
+                    except Exception as e:
+                        res = RunResult(
+                            False, f"Worker error: {type(e).__name__}: {e}", {}, None
+                        )
+                    self._record_result(vp, res)
+
+                    # Parallel results interleave: say which video they belong to
+                    who = "" if jobs == 1 else f"[{vp.name}] "
+                    status = "OK" if res.success else "FAIL"
+                    self._log(f"{who}Result: {status} | {res.message}")
+                    if res.output_srt:
+                        self._log(f"{who}Output: {res.output_srt}")
+                    if res.analysis:
+                        self._log(f"{who}Analysis: {res.analysis}")
+
+                    if res.success:
+                        ok_count += 1
+
+                # Redraw only when the whole percent changes, on the Tk thread
+                pct = done * 100 // total
+                if pct != last_pct:
+                    last_pct = pct
+                    self.root.after(0, lambda p=pct: self.progress.configure(value=p))
+
+                if self.stop_requested and not stopping:
+                    stopping = True
+                    self._log("Stop requested.")
+                fill()
 
-                self.progress["value"] = (i / total) * 100
+            pool.shutdown(wait=True)
+            if forwarder is not None:
+                log_queue.put(None)
+                forwarder.join()
 
             self._log(f"Done: {ok_count}/{total} succeeded.")
             self.processing = False
@@ -641,6 +966,19 @@ class App:
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _forward_worker_logs(self, log_queue: Any) -> None:
+        while True:
+            msg = log_queue.get()
+            if msg is None:
+                break
+            self._log(msg)
+
+    def _on_close(self) -> None:
+        # Don't lose a change still waiting in the debounce window
+        if self._save_after_id is not None:
+            self._save_settings_now()
+        self.root.destroy()
+
     def stop(self) -> None:
         if self.processing:
             self.stop_requested = True
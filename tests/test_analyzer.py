@@ -9,3 +9,31 @@ def test_missing_file():
         res["status"] in ("MISSING", "EMPTY", "UNKNOWN", "ERROR: FileNotFoundError")
         or res["size"] == 0
     )
+
+
+def test_counts_and_duration(tmp_path):
+    srt = tmp_path / "sample.srt"
+    blocks = [
+        f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\nLine {i}\n" for i in range(1, 7)
+    ]
+    srt.write_text("\n".join(blocks), encoding="utf-8")
+
+    res = analyze_srt_file(srt)
+    assert res["subtitles"] == 6
+    assert res["time_sequences"] == 6
+    assert res["empty_lines"] == 5
+    assert res["avg_subtitle_length"] == 6.0
+    assert res["duration_seconds"] == 6.5
+    assert res["has_content"] is True
+
+
+def test_utf16_bom_file(tmp_path):
+    srt = tmp_path / "utf16.srt"
+    text = "1\r\n00:00:01,000 --> 00:00:02,500\r\nȘtiință\r\n"
+    srt.write_bytes(text.encode("utf-16"))
+
+    res = analyze_srt_file(srt)
+    assert res["subtitles"] == 1
+    assert res["time_sequences"] == 1
+    assert res["avg_subtitle_length"] == 7.0
+    assert res["duration_seconds"] == 2.5
@@ -0,0 +1,12 @@
+from subtitle_ocr.config import load_defaults, reload_defaults
+
+
+def test_defaults_cached_until_reload(monkeypatch):
+    monkeypatch.setenv("PGSRIP_LANG", "ro")
+    first = reload_defaults()
+    assert first.pgsrip_lang == "ro"
+
+    monkeypatch.setenv("PGSRIP_LANG", "it")
+    assert load_defaults() is first
+    assert reload_defaults().pgsrip_lang == "it"
+    load_defaults.cache_clear()
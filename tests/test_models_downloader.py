@@ -0,0 +1,89 @@
+import gzip
+import io
+import json
+import urllib.error
+
+import pytest
+
+from subtitle_ocr import models_downloader as md
+
+URL = "https://api.github.com/repos/o/r/releases/latest"
+
+
+class _Resp(io.BytesIO):
+    def __init__(self, body: bytes, headers=None):
+        super().__init__(body)
+        self.headers = headers or {}
+
+
+def _http_error(code: int) -> urllib.error.HTTPError:
+    return urllib.error.HTTPError(URL, code, "error", {}, None)
+
+
+class _FakeOpener:
+    """Replays canned responses (or raises canned errors) in order."""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.requests = []
+
+    def open(self, req, timeout=None):
+        self.requests.append(req)
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+@pytest.fixture
+def opener(monkeypatch):
+    monkeypatch.setattr(md.time, "sleep", lambda _s: None)
+
+    def install(*replies):
+        fake = _FakeOpener(*replies)
+        monkeypatch.setattr(md, "_opener", lambda: fake)
+        return fake
+
+    return install
+
+
+def test_get_json_conditional_request_and_304(tmp_path, opener):
+    cache = tmp_path / md.RELEASE_CACHE_FILE
+    body = {"tag_name": "v1"}
+    fake = opener(
+        _Resp(
+            gzip.compress(json.dumps(body).encode()),
+            {"Content-Encoding": "gzip", "ETag": '"abc"', "Last-Modified": "Mon"},
+        ),
+        _http_error(304),
+    )
+
+    assert md._http_get_json(URL, cache_path=cache) == body
+    assert "If-none-match" not in fake.requests[0].headers
+
+    assert md._http_get_json(URL, cache_path=cache) == body
+    second = fake.requests[1]
+    assert second.get_header("If-none-match") == '"abc"'
+    assert second.get_header("If-modified-since") == "Mon"
+
+
+def test_get_json_without_validators_is_not_cached(tmp_path, opener):
+    cache = tmp_path / md.RELEASE_CACHE_FILE
+    opener(_Resp(b'{"tag_name": "v1"}'))
+
+    assert md._http_get_json(URL, cache_path=cache) == {"tag_name": "v1"}
+    assert not cache.exists()
+
+
+def test_open_retries_5xx_but_not_4xx(opener):
+    req = md.urllib.request.Request(URL)
+
+    fake = opener(_http_error(503), _Resp(b"ok"))
+    with md._open(req, timeout=1) as resp:
+        assert resp.read() == b"ok"
+    assert len(fake.requests) == 2
+
+    fake = opener(_http_error(404), _Resp(b"unused"))
+    with pytest.raises(urllib.error.HTTPError):
+        md._open(req, timeout=1)
+    assert len(fake.requests) == 1
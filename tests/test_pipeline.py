@@ -0,0 +1,189 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from subtitle_ocr import pipeline
+from subtitle_ocr.pipeline import check_tesseract
+from subtitle_ocr.types import OCRSettings, Paths, Tooling
+
+
+def test_check_tesseract_missing_exe():
+    ok, msg = check_tesseract(Path("this_tesseract_should_not_exist.exe"), "eng")
+    assert not ok
+    assert "not found" in msg
+
+
+def test_check_tesseract_uses_tessdata_prefix(tmp_path):
+    exe = tmp_path / "tesseract.exe"
+    exe.write_bytes(b"")
+    tessdata = tmp_path / "tessdata"
+    tessdata.mkdir()
+    (tessdata / "eng.traineddata").write_bytes(b"")
+
+    assert check_tesseract(exe, "eng", tessdata_prefix=tessdata) == (
+        True,
+        "Tesseract OK",
+    )
+    ok, msg = check_tesseract(exe, "ron", tessdata_prefix=tessdata)
+    assert ok
+    assert msg.startswith("WARNING")
+
+
+def test_check_tesseract_rejects_folder(tmp_path):
+    (tmp_path / "eng.traineddata").write_bytes(b"")
+    ok, msg = check_tesseract(tmp_path, "eng", tessdata_prefix=tmp_path)
+    assert not ok
+    assert "not a file" in msg
+
+
+_FAKE_PGSRIP = """
+import sys
+from pathlib import Path
+for arg in sys.argv[1:]:
+    v = Path(arg)
+    if v.stem != "broken":
+        srt = v.with_name(v.stem + ".en.srt")
+        srt.write_text("1\\n00:00:01,000 --> 00:00:02,000\\nHi\\n")
+        print("ripped", v.name)
+sys.exit(1 if any(Path(a).stem == "broken" for a in sys.argv[1:]) else 0)
+"""
+
+
+def test_process_videos_single_batch(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_cmd(settings, inputs):
+        calls.append(list(inputs))
+        return [sys.executable, "-c", _FAKE_PGSRIP] + [str(p) for p in inputs]
+
+    monkeypatch.setattr(pipeline, "_pgsrip_cmd", fake_cmd)
+    monkeypatch.setattr(pipeline.time, "sleep", lambda _s: None)
+    monkeypatch.setattr(pipeline, "_inject_path", lambda _t: None)
+
+    src = tmp_path / "in"
+    src.mkdir()
+    names = ("Ep1.mkv", "Ep1.part2.mkv", "broken.mkv", "Ep10.mkv")
+    videos = [src / n for n in names]
+    for v in videos:
+        v.write_bytes(b"")
+    out = tmp_path / "out"
+
+    results = pipeline.process_videos(
+        videos,
+        paths=Paths(src, out, tmp_path / "logs"),
+        tooling=Tooling(tesseract_exe=tmp_path / "tesseract.exe"),
+        settings=OCRSettings(pgsrip_lang="en", tess_lang="eng", tags=[]),
+    )
+
+    assert len(calls) == 1
+    assert [r.success for r in results] == [True, True, False, True]
+    assert "exit code 1" in results[2].message
+    assert results[0].output_srt == out / "Ep1.en.srt"
+    assert results[1].output_srt == out / "Ep1.part2.en.srt"
+    assert results[3].output_srt == out / "Ep10.en.srt"
+    assert results[3].output_srt.exists()
+    assert not list(src.glob("*.srt"))
+
+
+@pytest.mark.parametrize("other", ["Other.en.srt", "Ep1.part2.en.srt"])
+def test_process_video_strict_match_ignores_other_srt(tmp_path, monkeypatch, other):
+    # Simulates a concurrent job dropping its subtitle into the same folder
+    neighbour = f"from pathlib import Path; Path({other!r}).write_text('1\\n')"
+    monkeypatch.setattr(
+        pipeline, "_pgsrip_cmd", lambda s, i: [sys.executable, "-c", neighbour]
+    )
+    monkeypatch.setattr(pipeline.time, "sleep", lambda _s: None)
+    monkeypatch.setattr(pipeline, "_inject_path", lambda _t: None)
+
+    src = tmp_path / "in"
+    src.mkdir()
+    video = src / "Ep1.mkv"
+    video.write_bytes(b"")
+
+    res = pipeline.process_video(
+        video,
+        paths=Paths(src, tmp_path / "out", tmp_path / "logs"),
+        tooling=Tooling(tesseract_exe=tmp_path / "tesseract.exe"),
+        settings=OCRSettings(pgsrip_lang="en", tess_lang="eng", tags=[]),
+        strict_match=True,
+    )
+
+    assert not res.success
+    assert (src / other).exists()
+
+
+def test_tracker_ignores_reads_of_existing_srt(tmp_path):
+    old = tmp_path / "old.en.srt"
+    old.write_text("1\n")
+
+    with pipeline._NewSrtTracker((tmp_path,)) as tracker:
+        old.read_bytes()
+        (tmp_path / "new.en.srt").write_text("1\n")
+        found = tracker.new_files()
+
+    assert found == [tmp_path / "new.en.srt"]
+    # Nothing is written into the watched folder
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["new.en.srt", "old.en.srt"]
+
+
+def test_tracker_read_only_window_finds_nothing(tmp_path):
+    old = tmp_path / "old.en.srt"
+    old.write_text("1\n")
+
+    with pipeline._NewSrtTracker((tmp_path,)) as tracker:
+        old.read_bytes()
+        assert tracker.new_files() == []
+
+
+@pytest.mark.parametrize("watcher", ["events", "events_lost", "none"])
+def test_process_video_does_not_take_previous_output(tmp_path, monkeypatch, watcher):
+    monkeypatch.setattr(
+        pipeline,
+        "_pgsrip_cmd",
+        lambda s, inputs: [sys.executable, "-c", _FAKE_PGSRIP]
+        + [str(p) for p in inputs if p.stem != "NoSubs"],
+    )
+    monkeypatch.setattr(pipeline.time, "sleep", lambda _s: None)
+    monkeypatch.setattr(pipeline, "_inject_path", lambda _t: None)
+    if watcher == "events_lost":
+        monkeypatch.setattr(pipeline._NewSrtTracker, "_on_event", lambda *a: None)
+    elif watcher == "none":
+        monkeypatch.setattr(pipeline, "Observer", None)
+
+    src = tmp_path / "in"
+    src.mkdir()
+    out = tmp_path / "out"
+    kwargs = dict(
+        paths=Paths(src, out, tmp_path / "logs"),
+        tooling=Tooling(tesseract_exe=tmp_path / "tesseract.exe"),
+        settings=OCRSettings(pgsrip_lang="en", tess_lang="eng", tags=[]),
+    )
+    results = []
+    for name in ("Movie.mkv", "NoSubs.mkv"):
+        (src / name).write_bytes(b"")
+        results.append(pipeline.process_video(src / name, **kwargs))
+
+    assert [r.success for r in results] == [True, False]
+    assert sorted(p.name for p in out.iterdir()) == ["Movie.en.srt"]
+
+
+def test_inject_path_puts_configured_tools_first(tmp_path, monkeypatch):
+    sep = os.pathsep
+    a = tmp_path / "a" / "tesseract.exe"
+    b = tmp_path / "b" / "tesseract.exe"
+    monkeypatch.setenv("PATH", sep.join(["/other/bin", str(a.parent), "/usr/bin"]))
+
+    pipeline._inject_path(Tooling(tesseract_exe=a))
+    assert os.environ["PATH"].split(sep) == [str(a.parent), "/other/bin", "/usr/bin"]
+
+    # Switching A -> B -> A must leave A first, without duplicates
+    pipeline._inject_path(Tooling(tesseract_exe=b))
+    pipeline._inject_path(Tooling(tesseract_exe=a))
+    assert os.environ["PATH"].split(sep) == [
+        str(a.parent),
+        str(b.parent),
+        "/other/bin",
+        "/usr/bin",
+    ]
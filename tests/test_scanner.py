@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from subtitle_ocr.scanner import scan_video_entries, scan_videos
+
+
+def test_scan_videos_filters_and_sorts(tmp_path):
+    for name in ("b.MKV", "a.mp4", "notes.txt", "c.ts"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "folder.mkv").mkdir()
+
+    assert [p.name for p in scan_videos(tmp_path)] == ["a.mp4", "b.MKV", "c.ts"]
+    assert [p.name for p in scan_videos(tmp_path, [".TXT"])] == ["notes.txt"]
+
+
+def test_scan_videos_missing_folder():
+    assert scan_videos(Path("this_folder_should_not_exist")) == []
+
+
+def test_scan_video_entries_sizes(tmp_path):
+    (tmp_path / "b.mkv").write_bytes(b"12345")
+    (tmp_path / "a.mp4").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"x")
+
+    assert [(p.name, size) for p, size in scan_video_entries(tmp_path)] == [
+        ("a.mp4", 0),
+        ("b.mkv", 5),
+    ]
@@ -0,0 +1,21 @@
+from subtitle_ocr.settings_store import GUISettings, load_settings, save_settings
+
+
+def test_save_roundtrip_and_skip_unchanged(tmp_path):
+    p = tmp_path / "settings.json"
+    s = GUISettings(input_dir="C:\\Filme", tags="ocr tidy", max_workers=2)
+
+    assert save_settings(s, p) == p
+    assert load_settings(p) == s
+
+    mtime = p.stat().st_mtime_ns
+    save_settings(s, p)
+    assert p.stat().st_mtime_ns == mtime
+    assert not (tmp_path / "settings.json.tmp").exists()
+
+
+def test_load_ignores_unknown_keys(tmp_path):
+    p = tmp_path / "settings.json"
+    p.write_text('{"tags": "ocr", "max_workers": 2, "obsolete": 1}', encoding="utf-8")
+
+    assert load_settings(p) == GUISettings(tags="ocr", max_workers=2)
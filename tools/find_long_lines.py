@@ -1,7 +1,18 @@
+import re
 from pathlib import Path
 
+MAX_LEN = 88
+# Candidate lines by byte length; one C-level scan per file. UTF-8 text is
+# never shorter in bytes than in characters, so no long line is missed.
+_LONG = re.compile(rb"^[^\r\n]{%d,}" % (MAX_LEN + 1), re.MULTILINE)
+
 root = Path('src')
 for p in sorted(root.rglob('*.py')):
-    for i, line in enumerate(p.read_text(encoding='utf-8').splitlines(), start=1):
-        if len(line) > 88:
-            print(f"{p}:{i}:{len(line)}")
+    data = p.read_bytes()
+    lineno, pos = 1, 0
+    for m in _LONG.finditer(data):
+        lineno += data.count(b"\n", pos, m.start())
+        pos = m.start()
+        length = len(m.group().decode('utf-8'))
+        if length > MAX_LEN:
+            print(f"{p}:{lineno}:{length}")